@@ -9,6 +9,7 @@ of different types of IoT devices, such as switches, sensors, and alarms.
 Classes
 -------
 
+- Attr: Enumeration of the abstract IOT device properties.
 - Availability: Represents the availability status of a device.
 - Registry: Represents a registry of discovered devices.
 - DeviceState: Root class for all device state classes.
@@ -19,6 +20,7 @@ Classes
 - ButtonValues: Enumeration representing possible button actions.
 - Button: Represents the state of a button device.
 - ADC: Represents the state of an ADC (Analog-to-Digital Converter) device.
+- OtaUpdate: Represents the firmware update status published by Zigbee2MQTT.
 - SrtsA01: Represents the state of a specific Zigbee thermostat device.
 - AlarmVolumes: Enumeration representing possible alarm volume levels.
 - Alarm: Represents the state of an alarm device.
@@ -28,55 +30,125 @@ Constants
 
 - POWER_ON: String constant representing the "ON" state.
 - POWER_OFF: String constant representing the "OFF" state.
+- ACTION, ALARM, ..., WINDOW_OPEN: Aliases of the Attr members.
+
+Types
+-----
+
+- PowerValues: Literal type of the power state of a switch channel.
+- PresetValues, SensorValues, SystemModeValues: Literal types of SrtsA01 modes.
+- VolumeValues: Literal type of the alarm volume levels.
 
 """
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Literal, Optional
-
-from pydantic import AliasChoices, BaseModel, Field, computed_field, confloat
-
-# Abstract IOT device properties
-
-ACTION = "action"
-ALARM = "alarm"
-AWAY_PRESET_TEMPERATURE = "away_preset_temperature"
-BATTERY = "battery"
-BATTERY_LOW = "battery_low"
-CALIBRATED = "calibrated"
-CHILD_LOCK = "child_lock"
-DEVICE_TEMPERATURE = "device_temperature"
-DURATION = "duration"
-EXTERNAL_TEMPERATURE_INPUT = "external_temperature_input"
-HUMIDITY = "humidity"
-INTERNAL_HEATING_SETPOINT = "internal_heating_setpoint"
-LINKQUALITY = "linkquality"
-LOCAL_TEMPERATURE = "local_temperature"
-MELODY = "melody"
-OCCUPIED_HEATING_SETPOINT = "occupied_heating_setpoint"
-OCCUPANCY = "occupancy"
-POWER = "power"
-POWER1 = "power1"
-POWER2 = "power2"
-POWER_ON_BEHAVIOUR = "power_on_behavior"
-POWER_OUTAGE_COUNT = "power_outage_count"
-PRESET = "preset"
-RANGE = "Range"
-SCHEDULE = "schedule"
-SCHEDULE_SETTING = "schedule_setting"
-SENSOR = "sensor"
-SETUP = "setup"
-SYSTEM_MODE = "system_mode"
-TAMPER = "tamper"
-TEMPERATURE = "temperature"
-UPDATE = "update"
-VALVE_ALARM = "valve_alarm"
-VALVE_DETECTION = "valve_detection"
-VOLTAGE = "voltage"
-VOLUME = "volume"
-WINDOW_DETECTION = "window_detection"
-WINDOW_OPEN = "window_open"
+from functools import cached_property
+from typing import Annotated, List, Literal, Optional
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, computed_field
+
+
+class Attr(str, Enum):
+    """
+    Enumeration of the abstract IOT device properties.
+
+    Members compare equal to their string value, so they can be used directly
+    as payload keys.
+    """
+
+    ACTION = "action"
+    ALARM = "alarm"
+    AWAY_PRESET_TEMPERATURE = "away_preset_temperature"
+    BATTERY = "battery"
+    BATTERY_LOW = "battery_low"
+    CALIBRATED = "calibrated"
+    CHILD_LOCK = "child_lock"
+    DEVICE_TEMPERATURE = "device_temperature"
+    DURATION = "duration"
+    EXTERNAL_TEMPERATURE_INPUT = "external_temperature_input"
+    HUMIDITY = "humidity"
+    INTERNAL_HEATING_SETPOINT = "internal_heating_setpoint"
+    LINKQUALITY = "linkquality"
+    LOCAL_TEMPERATURE = "local_temperature"
+    MELODY = "melody"
+    OCCUPIED_HEATING_SETPOINT = "occupied_heating_setpoint"
+    OCCUPANCY = "occupancy"
+    POWER = "power"
+    POWER1 = "power1"
+    POWER2 = "power2"
+    POWER_ON_BEHAVIOUR = "power_on_behavior"
+    POWER_OUTAGE_COUNT = "power_outage_count"
+    PRESET = "preset"
+    RANGE = "Range"
+    SCHEDULE = "schedule"
+    SCHEDULE_SETTING = "schedule_setting"
+    SENSOR = "sensor"
+    SETUP = "setup"
+    SYSTEM_MODE = "system_mode"
+    TAMPER = "tamper"
+    TEMPERATURE = "temperature"
+    UPDATE = "update"
+    VALVE_ALARM = "valve_alarm"
+    VALVE_DETECTION = "valve_detection"
+    VOLTAGE = "voltage"
+    VOLUME = "volume"
+    WINDOW_DETECTION = "window_detection"
+    WINDOW_OPEN = "window_open"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+# Abstract IOT device properties, kept as module constants for compatibility
+
+ACTION = Attr.ACTION
+ALARM = Attr.ALARM
+AWAY_PRESET_TEMPERATURE = Attr.AWAY_PRESET_TEMPERATURE
+BATTERY = Attr.BATTERY
+BATTERY_LOW = Attr.BATTERY_LOW
+CALIBRATED = Attr.CALIBRATED
+CHILD_LOCK = Attr.CHILD_LOCK
+DEVICE_TEMPERATURE = Attr.DEVICE_TEMPERATURE
+DURATION = Attr.DURATION
+EXTERNAL_TEMPERATURE_INPUT = Attr.EXTERNAL_TEMPERATURE_INPUT
+HUMIDITY = Attr.HUMIDITY
+INTERNAL_HEATING_SETPOINT = Attr.INTERNAL_HEATING_SETPOINT
+LINKQUALITY = Attr.LINKQUALITY
+LOCAL_TEMPERATURE = Attr.LOCAL_TEMPERATURE
+MELODY = Attr.MELODY
+OCCUPIED_HEATING_SETPOINT = Attr.OCCUPIED_HEATING_SETPOINT
+OCCUPANCY = Attr.OCCUPANCY
+POWER = Attr.POWER
+POWER1 = Attr.POWER1
+POWER2 = Attr.POWER2
+POWER_ON_BEHAVIOUR = Attr.POWER_ON_BEHAVIOUR
+POWER_OUTAGE_COUNT = Attr.POWER_OUTAGE_COUNT
+PRESET = Attr.PRESET
+RANGE = Attr.RANGE
+SCHEDULE = Attr.SCHEDULE
+SCHEDULE_SETTING = Attr.SCHEDULE_SETTING
+SENSOR = Attr.SENSOR
+SETUP = Attr.SETUP
+SYSTEM_MODE = Attr.SYSTEM_MODE
+TAMPER = Attr.TAMPER
+TEMPERATURE = Attr.TEMPERATURE
+UPDATE = Attr.UPDATE
+VALVE_ALARM = Attr.VALVE_ALARM
+VALVE_DETECTION = Attr.VALVE_DETECTION
+VOLTAGE = Attr.VOLTAGE
+VOLUME = Attr.VOLUME
+WINDOW_DETECTION = Attr.WINDOW_DETECTION
+WINDOW_OPEN = Attr.WINDOW_OPEN
+
+
+# Validation aliases, shared by the models and ordered so that the key sent by
+# the devices comes first: Zigbee2MQTT publishes "state" and "last_seen",
+# Tasmota "POWER", "POWER1", "POWER2" and "Time".
+_LAST_SEEN_ALIASES = AliasChoices("last_seen", "Time")
+_POWER_ALIASES = AliasChoices("state", "POWER", "power")
+_POWER1_ALIASES = AliasChoices("POWER1", "power1")
+_POWER2_ALIASES = AliasChoices("POWER2", "power2")
 
 
 class Availability(BaseModel):
@@ -98,7 +170,7 @@ class Registry(BaseModel):
         device_names (List[str]): A list of device names.
     """
 
-    device_names: List[str] = []
+    device_names: List[str] = Field(default_factory=list)
 
 
 class DeviceState(BaseModel):
@@ -106,7 +178,7 @@ class DeviceState(BaseModel):
     Root class for all device state classes.
 
     This class serves as the base for various device state representations,
-    providing common attributes and functionality.
+    providing common attributes and functionality. Device states are immutable.
 
     Attributes:
         last_seen (Optional[datetime]): The timestamp of when the device was
@@ -114,8 +186,20 @@ class DeviceState(BaseModel):
                                         using aliases "last_seen" or "Time".
     """
 
+    # Pinned explicitly so the core schema of every subclass is built eagerly at
+    # class creation, without assignment validation on the decoding path.
+    # States are frozen: a decoded snapshot is never updated in place, and the
+    # shared instances (SWITCH_ON, SWITCH_OFF) cannot be altered by a consumer.
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        validate_assignment=False,
+        populate_by_name=True,
+        defer_build=False,
+    )
+
     last_seen: Optional[datetime] = Field(
-        default=None, validation_alias=AliasChoices("last_seen", "Time")
+        default=None, validation_alias=_LAST_SEEN_ALIASES
     )
 
 
@@ -135,6 +219,11 @@ class AirSensor(DeviceState):
 POWER_ON = "ON"
 POWER_OFF = "OFF"
 
+# Value domains shared by several fields: kept as literal strings so that
+# pydantic-core validates them with a plain lookup and no enum wrapping, and
+# the encoded payloads stay unchanged on the wire.
+PowerValues = Literal["ON", "OFF"]
+
 
 class Switch(DeviceState):
     """
@@ -143,17 +232,16 @@ class Switch(DeviceState):
     Attributes:
         power_on_behavior (Optional[str]): The behavior of the switch when power is restored.
         power (str): The current power state of the switch: "ON" or "OFF"
-            This field can be accessed using aliases "power", "state", or "POWER".
+            This field can be accessed using aliases "state", "POWER" or "power".
     """
 
     power_on_behavior: Optional[str] = None
-    power: Optional[Literal["ON", "OFF"]] = Field(
-        validation_alias=AliasChoices("power", "state", "POWER")
-    )
+    power: Optional[PowerValues] = Field(validation_alias=_POWER_ALIASES)
 
 
-SWITCH_ON = Switch(power=POWER_ON)
-SWITCH_OFF = Switch(power=POWER_OFF)
+# Known-good constant states: built without running the validators.
+SWITCH_ON = Switch.model_construct(power=POWER_ON)
+SWITCH_OFF = Switch.model_construct(power=POWER_OFF)
 
 
 class Switch2Channels(DeviceState):
@@ -162,16 +250,16 @@ class Switch2Channels(DeviceState):
 
     Attributes:
         power1 (str): The current power state of the first channel: "ON" or "OFF"
-            This field can be accessed using aliases "power1" or "POWER1".
+            This field can be accessed using aliases "POWER1" or "power1".
         power2 (str): The current power state of the second channel: "ON" or "OFF"
-            This field can be accessed using aliases "power2" or "POWER2".
+            This field can be accessed using aliases "POWER2" or "power2".
     """
 
-    power1: Optional[Literal["ON", "OFF"]] = Field(
-        default=None, validation_alias=AliasChoices("power1", "POWER1")
+    power1: Optional[PowerValues] = Field(
+        default=None, validation_alias=_POWER1_ALIASES
     )
-    power2: Optional[Literal["ON", "OFF"]] = Field(
-        default=None, validation_alias=AliasChoices("power2", "POWER2")
+    power2: Optional[PowerValues] = Field(
+        default=None, validation_alias=_POWER2_ALIASES
     )
 
 
@@ -219,31 +307,62 @@ class ADC(DeviceState):
     Represents the state of an ADC (Analog-to-Digital Converter) device.
 
     Attributes:
-        Range (Optional[float]): The range value of the ADC.
-        voltage (float): The computed voltage based on the range value.
+        Range (Optional[float]): The range value of the ADC. This field is immutable.
+        voltage (Optional[float]): The computed voltage based on the range value.
     """
 
     Range: Optional[float] = Field(default=None)
 
+    # A frozen reading never changes, so the voltage is computed once.
     @computed_field
-    @property
-    def voltage(self) -> float:
+    @cached_property
+    def voltage(self) -> Optional[float]:
         """
         Calculate the voltage based on the range.
 
         Returns:
-            float: The calculated voltage in volts.
+            Optional[float]: The calculated voltage in volts, or None if no range is set.
         """
+        if self.Range is None:
+            return None
         return self.Range / 100
 
 
+class OtaUpdate(BaseModel):
+    """
+    Represents the firmware update (OTA) status published by Zigbee2MQTT.
+
+    Attributes:
+        installed_version (Optional[int]): The firmware version installed on the device.
+        latest_version (Optional[int]): The latest firmware version available.
+        progress (Optional[float]): The update progress in percent, while updating.
+        remaining (Optional[int]): The estimated remaining time in seconds, while updating.
+        state (Optional[str]): The update state: "idle", "available" or "updating".
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    installed_version: Optional[int] = None
+    latest_version: Optional[int] = None
+    progress: Optional[float] = None
+    remaining: Optional[int] = None
+    state: Optional[str] = None
+
+
+PresetValues = Literal["manual", "away", "auto"]
+SensorValues = Literal["internal", "external"]
+SystemModeValues = Literal["off", "heat"]
+
+
 class SrtsA01(DeviceState):
     """
     Represents the state of a Smart radiator thermostat AQARA SRTS-A01.
     """
 
     # Température d'absence pré-définie
-    away_preset_temperature: Optional[confloat(gt=-10.0, lt=35.0)] = None
+    away_preset_temperature: Annotated[
+        Optional[float], Field(default=None, gt=-10.0, lt=35.0)
+    ]
     # Batterie restante en %, peut prendre jusqu'à 24 heures avant d'être signalée.
     battery: Optional[int] = None
     # Indique si cette vanne est calibrée, utilisez l'option calibrer
@@ -255,18 +374,22 @@ class SrtsA01(DeviceState):
     device_temperature: Optional[float] = None
     # Entrée pour le capteur de température à distance
     # (lorsque le capteur est réglé sur externe)
-    external_temperature_input: Optional[confloat(gt=0, lt=55)] = None
+    external_temperature_input: Annotated[
+        Optional[float], Field(default=None, gt=0, lt=55)
+    ]
     internal_heating_setpoint: Optional[float] = None
     # Qualité du lien (force du signal)
     linkquality: Optional[int] = None
     # Température actuelle mesurée par le capteur interne ou externe
     local_temperature: Optional[float] = None
     # Consigne de température
-    occupied_heating_setpoint: Optional[confloat(gt=5, lt=30)] = None
+    occupied_heating_setpoint: Annotated[
+        Optional[float], Field(default=None, gt=5, lt=30)
+    ]
     # Nombre de pannes de courant (depuis le dernier couplage)
     power_outage_count: Optional[int] = None
     # Mode de l'appareil (similaire à system_mode): 'manual', 'away', 'auto'
-    preset: Optional[Literal["manual", "away", "auto"]] = None
+    preset: Optional[PresetValues] = None
     # Lorsqu'il est activé, l'appareil change d'état en fonction de vos
     # paramètres de programmation.
     schedule: Optional[bool] = None
@@ -274,12 +397,13 @@ class SrtsA01(DeviceState):
     # lun, mar, mer, jeu, ven|8:00,24.0|18:00,17.0|23:00,22.0|8:00,22.0)
     schedule_settings: Optional[str] = None
     # Sélectionnez le détecteur température à utiliser
-    sensor: Optional[Literal["internal", "external"]] = None
+    sensor: Optional[SensorValues] = None
     # Indique si l'appareil est en mode configuration (E11)
     setup: Optional[bool] = None
     # Mode de l'appareil
-    system_mode: Optional[Literal["off", "heat"]] = None
-    update: Optional[dict] = None
+    system_mode: Optional[SystemModeValues] = None
+    # État de la mise à jour du micrologiciel (lecture seule, jamais sérialisé)
+    update: Optional[OtaUpdate] = Field(default=None, exclude=True, repr=False)
     # Avertit d'une anomalie de contrôle de la température si la détection
     # de la vanne est activée (par exemple, thermostat mal installé,
     # défaillance de la vanne ou étalonnage incorrect, lien incorrect
@@ -311,6 +435,9 @@ class AlarmVolumes(str, Enum):
     HIGH = "high"
 
 
+VolumeValues = Literal["low", "medium", "high"]
+
+
 class Alarm(DeviceState):
     """
     Represents the state of an alarm device.
@@ -320,11 +447,11 @@ class Alarm(DeviceState):
         battery_low (Optional[bool]): Indicates whether the battery is low.
         duration (Optional[int]): Duration of the alarm.
         melody (Optional[int]): Melody of the alarm.
-        volume (Optional[Literal["low", "medium", "high"]]): Volume level of the alarm.
+        volume (Optional[VolumeValues]): Volume level of the alarm.
     """
 
     alarm: Optional[bool] = None
     battery_low: Optional[bool] = None
     duration: Optional[int] = None
     melody: Optional[int] = None
-    volume: Optional[Literal["low", "medium", "high"]] = None
+    volume: Optional[VolumeValues] = None
@@ -20,14 +20,16 @@ Functions
 - get_refined_data_queue: Returns a queue of refined messages by processing raw messages from MQTT.
 
 """
-import json
+import heapq
+import itertools
 import threading
 import time
-from queue import Queue
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache, partial
+from queue import Full, Queue
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
+import orjson
 import paho.mqtt.client as mqtt
-from pydantic import BaseModel, ValidationError
 
 from iot2mqtt import (abstract, dev, encoder, messenger, mqtthelper, processor,
                       utils)
@@ -37,12 +39,69 @@ Z2M_CMND_BASE_TOPIC = "zigbee2mqtt"
 TASMOTA_INFO_BASE_TOPIC = "tele"
 TASMOTA_CMND_BASE_TOPIC = "cmnd"
 TASMOTA_DISCOVERY_TOPIC = "tasmota/discovery"
+TASMOTA_BACKLOG_COMMAND = "Backlog"
 
 DEFAULT_ON_TIME = 5.0
 DEFAULT_OFF_TIME = 0.0
 
+QUEUE_MAX_SIZE = 4096
 
-class _TopicManager(metaclass=utils.Singleton):
+DISCOVERY_QUIET_TIME = 0.2
+DISCOVERY_TIMEOUT = 2.0
+
+# Aliases resolved once for the message processing hot path
+_TASMOTA = dev.Protocol.TASMOTA
+_STATE = messenger.MessageType.STATE
+_Item = messenger.Item
+_Message = messenger.Message
+
+
+@lru_cache(maxsize=None)
+def _z2m_get_payload(fields: tuple) -> bytes:
+    """
+    Build the Zigbee2MQTT payload requesting the state of the given fields.
+
+    The payload only depends on the gettable fields of a model, it is thus
+    serialized once per set of fields.
+
+    Args:
+        fields (tuple): The names of the fields to retrieve.
+
+    Returns:
+        bytes: The JSON payload, e.g. b'{"state":""}'.
+    """
+    return orjson.dumps({_field: "" for _field in fields})
+
+
+def _tasmota_command(
+    base: str, device_name: str, commands: Dict[str, Any]
+) -> Tuple[str, str]:
+    """
+    Build the topic and payload sending Tasmota commands in a single MQTT message.
+
+    A single command is published to its own topic, several commands are grouped
+    in a Backlog command, e.g. "Power1 ON; Power2 OFF".
+
+    Args:
+        base (str): The Tasmota command base topic.
+        device_name (str): The name of the device.
+        commands (Dict[str, Any]): The command names and their parameter, an empty
+            parameter queries the current value.
+
+    Returns:
+        Tuple[str, str]: The command topic and the payload.
+    """
+    if len(commands) == 1:
+        ((_command, _parameter),) = commands.items()
+        return f"{base}/{device_name}/{_command}", str(_parameter)
+    _backlog = "; ".join(
+        f"{_command} {_parameter}" if _parameter != "" else str(_command)
+        for _command, _parameter in commands.items()
+    )
+    return f"{base}/{device_name}/{TASMOTA_BACKLOG_COMMAND}", _backlog
+
+
+class _TopicManager:
     """
     A registry for managing topic configurations based on protocol and message type.
 
@@ -50,6 +109,8 @@ class _TopicManager(metaclass=utils.Singleton):
     for different combinations of protocol and message type. It acts as a registry
     for topic configurations, allowing easy access to the topic base, topic extension,
     and device name offset for a given protocol and message type.
+
+    Each manager has a single module-level instance, configured at import time.
     """
 
     def __init__(self) -> None:
@@ -106,21 +167,10 @@ class _CommandTopicManager(_TopicManager):
         )
 
 
-class _InfoTopicRegistryKey(BaseModel):
-    """
-    A key used to uniquely identify a topic configuration based on the
-    protocol and message type.
-    """
-
-    protocol: dev.Protocol
-    message_type: messenger.MessageType
-
-    class Config:
-        "Pydantic configuration for the InfoTopicRegistryKey class."
-        frozen = True
+_command_topic_manager = _CommandTopicManager()
 
 
-class _InfoTopicRegistry(BaseModel):
+class _InfoTopicRegistry(NamedTuple):
     """
     Registered values for a given protocol and message type.
     """
@@ -137,8 +187,18 @@ class _InfoTopicManager(_TopicManager):
     This class provides methods to register, retrieve, and resolve MQTT topics
     based on protocol and message type. It acts as a registry for topic configurations,
     allowing easy access to the topic base, topic extension, and device name offset.
+
+    The registry is keyed by plain ``(protocol, message_type)`` tuples: both members
+    are hashable enums, so the per-message lookup is a single dict access. The device
+    name offsets and the topics to subscribe are materialized on registration, as they
+    never change afterwards.
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._offsets: Dict[Tuple[dev.Protocol, messenger.MessageType], int] = {}
+        self._topics: Tuple[str, ...] = ()
+
     def resolve_wildcards(
         self,
         protocol: dev.Protocol,
@@ -149,13 +209,19 @@ class _InfoTopicManager(_TopicManager):
         """
         Resolve wildcards in the topic based on the protocol and message type.
         """
-        _registry_key = _InfoTopicRegistryKey(
-            protocol=protocol, message_type=message_type
-        )
-        _registry_value = self._topic_registry.get(_registry_key)
-        _offset = _registry_value.device_name_offset
-        _result = topic[_offset:].split("/")[position]
-        return _result
+        _offset = self._offsets[(protocol, message_type)]
+        # Split no further than the requested level
+        return topic[_offset:].split("/", position + 1)[position]
+
+    def get_topic_levels(
+        self, protocol: dev.Protocol, message_type: messenger.MessageType, topic: str
+    ) -> List[str]:
+        """
+        Get the levels of the topic starting at the device name, in a single split.
+
+        The first level is the device name and the second one, if any, the sub-topic.
+        """
+        return topic[self._offsets[(protocol, message_type)] :].split("/", 2)
 
     def get_sub_topic(
         self, protocol: dev.Protocol, message_type: messenger.MessageType, topic: str
@@ -163,13 +229,8 @@ class _InfoTopicManager(_TopicManager):
         """
         Get the sub-topic from the given topic based on the protocol and message type.
         """
-        _registry_key = _InfoTopicRegistryKey(
-            protocol=protocol, message_type=message_type
-        )
-        _registry_value = self._topic_registry.get(_registry_key)
-        _offset = _registry_value.device_name_offset
-        _sub_topic = topic[_offset:].split("/")[1]
-        return _sub_topic
+        _offset = self._offsets[(protocol, message_type)]
+        return topic[_offset:].split("/", 2)[1]
 
     def get_topic_to_subscribe(
         self, protocol: dev.Protocol, message_type: messenger.MessageType
@@ -177,17 +238,15 @@ class _InfoTopicManager(_TopicManager):
         """
         Get the topic to subscribe to based on the protocol and message type.
         """
-        _registry_key = _InfoTopicRegistryKey(
-            protocol=protocol, message_type=message_type
-        )
+        _registry_key = (protocol, message_type)
         _registry_value = self._topic_registry.get(_registry_key)
         return _registry_value.topic_to_subscribe
 
-    def get_all_topics_to_subscribe(self) -> List[str]:
+    def get_all_topics_to_subscribe(self) -> Tuple[str, ...]:
         """
-        Get a list of all topics to subscribe to.
+        Get all topics to subscribe to.
         """
-        return [x.topic_to_subscribe for x in self._topic_registry.values()]
+        return self._topics
 
     def register(
         self,
@@ -199,9 +258,7 @@ class _InfoTopicManager(_TopicManager):
         """
         Register a topic configuration.
         """
-        _registry_key = _InfoTopicRegistryKey(
-            protocol=protocol, message_type=message_type
-        )
+        _registry_key = (protocol, message_type)
         if _registry_key in self._topic_registry:
             raise ValueError("Key is already registered")
         _registry_value = _InfoTopicRegistry(
@@ -210,6 +267,8 @@ class _InfoTopicManager(_TopicManager):
             device_name_offset=len(info_topic_base) + 1,
         )
         self._topic_registry[_registry_key] = _registry_value
+        self._offsets[_registry_key] = _registry_value.device_name_offset
+        self._topics += (_registry_value.topic_to_subscribe,)
 
     def configure_topic_registry(self) -> None:
         """
@@ -253,6 +312,9 @@ class _InfoTopicManager(_TopicManager):
         )
 
 
+_info_topic_manager = _InfoTopicManager()
+
+
 class Scrutinizer:
     """
     A class responsible for subscribing to MQTT topics and processing incoming messages.
@@ -284,10 +346,14 @@ class Scrutinizer:
         def _callback_add(
             protocol: dev.Protocol,
             message_type: messenger.MessageType,
-            callback: Callable[[messenger.Message], None],
         ):
-            _topic = _InfoTopicManager().get_topic_to_subscribe(protocol, message_type)
-            self._mqtt_client.message_callback_add(_topic, callback)
+            # Bind the protocol and message type once, so that paho calls
+            # _process_message directly for each incoming message
+            _topic = _info_topic_manager.get_topic_to_subscribe(protocol, message_type)
+            _callback = partial(
+                self._process_message, protocol=protocol, message_type=message_type
+            )
+            self._mqtt_client.message_callback_add(_topic, _callback)
 
         _z2m = dev.Protocol.Z2M
         _tasmota = dev.Protocol.TASMOTA
@@ -295,46 +361,23 @@ class Scrutinizer:
         _state = messenger.MessageType.STATE
         _disco = messenger.MessageType.DISCO
         # Set availability handlers
-        _callback_add(_z2m, _avail, self._on_z2m_avail)
-        _callback_add(_tasmota, _avail, self._on_tasmota_avail)
+        _callback_add(_z2m, _avail)
+        _callback_add(_tasmota, _avail)
         # Set state handlers
-        _callback_add(_z2m, _state, self._on_z2m_state)
-        _callback_add(_tasmota, _state, self._on_tasmota_state)
+        _callback_add(_z2m, _state)
+        _callback_add(_tasmota, _state)
         # Set discovery handlers
-        _callback_add(_z2m, _disco, self._on_z2m_disco)
-        _callback_add(_tasmota, _disco, self._on_tasmota_disco)
+        _callback_add(_z2m, _disco)
+        _callback_add(_tasmota, _disco)
         # Set connection handler
         self._mqtt_client.connect_handler_add(self._on_connect)
 
-    def _json_to_item(
-        self,
-        protocol: dev.Protocol,
-        message_type: messenger.MessageType,
-        topic: str,
-        payload: str,
-    ) -> messenger.Item:
+    @staticmethod
+    def _json_to_item(payload: bytes, tag: Optional[str]) -> messenger.Item:
         """
         Convert a JSON payload to a messenger.Item object.
         """
-        try:
-            _payload = json.loads(payload)
-            _tag = None
-            if protocol == dev.Protocol.TASMOTA:
-                _tag = _InfoTopicManager().resolve_wildcards(
-                    protocol=protocol,
-                    message_type=message_type,
-                    topic=topic,
-                    position=1,
-                )
-            return messenger.Item(data=_payload, tag=_tag)
-        except ValidationError as exc:
-            utils.i2m_log.error(
-                "Failed to parse message: %s - data: %s - tag: %s",
-                repr(exc.errors()[0]["type"]),
-                _payload,
-                _tag,
-            )
-            return None
+        return _Item(data=orjson.loads(payload), tag=tag)
 
     def _process_message(
         self,
@@ -348,83 +391,36 @@ class Scrutinizer:
         Process an incoming MQTT message and put the result in the output queue.
         """
         topic = mqtt_message.topic
-        _raw_payload = str(mqtt_message.payload.decode("utf-8"))
-        if _raw_payload is None:
+        _raw_payload = mqtt_message.payload
+        if not _raw_payload:
             utils.i2m_log.info("Received empty message on topic %s", topic)
             return
-        _device_name = _InfoTopicManager().resolve_wildcards(
+        # The topic is parsed once: device name first, then the Tasmota tag
+        _topic_levels = _info_topic_manager.get_topic_levels(
             protocol=protocol, message_type=message_type, topic=topic
         )
+        _is_tasmota = protocol is _TASMOTA
+        _tag = _topic_levels[1] if _is_tasmota else None
         try:
-            _item = self._json_to_item(
-                protocol=protocol,
-                message_type=message_type,
-                topic=topic,
-                payload=_raw_payload,
-            )
-        except json.JSONDecodeError:
-            _is_tasmota = protocol == dev.Protocol.TASMOTA
-            _is_state = message_type == messenger.MessageType.STATE
-            if _is_tasmota and _is_state:
+            _item = self._json_to_item(payload=_raw_payload, tag=_tag)
+        except orjson.JSONDecodeError:
+            if _is_tasmota and message_type is _STATE:
                 utils.i2m_log.debug("[%s] dismissed topic", topic)
                 return
-            _item = messenger.Item(data=_raw_payload)
-        _incoming = messenger.Message(
+            _item = _Item(data=_raw_payload.decode("utf-8"))
+        _incoming = _Message(
             protocol=protocol,
             model=None,
-            device_name=_device_name,
+            device_name=_topic_levels[0],
             message_type=message_type,
             raw_item=_item,
         )
-        self._output_queue.put(_incoming, block=True, timeout=self._queue_timeout)
-
-    def _on_z2m_avail(self, *argc, **kwargs) -> None:
-        self._process_message(
-            *argc,
-            **kwargs,
-            protocol=dev.Protocol.Z2M,
-            message_type=messenger.MessageType.AVAIL,
-        )
-
-    def _on_tasmota_avail(self, *argc, **kwargs) -> None:
-        self._process_message(
-            *argc,
-            **kwargs,
-            protocol=dev.Protocol.TASMOTA,
-            message_type=messenger.MessageType.AVAIL,
-        )
-
-    def _on_z2m_state(self, *argc, **kwargs) -> None:
-        self._process_message(
-            *argc,
-            **kwargs,
-            protocol=dev.Protocol.Z2M,
-            message_type=messenger.MessageType.STATE,
-        )
-
-    def _on_tasmota_state(self, *argc, **kwargs) -> None:
-        self._process_message(
-            *argc,
-            **kwargs,
-            protocol=dev.Protocol.TASMOTA,
-            message_type=messenger.MessageType.STATE,
-        )
-
-    def _on_z2m_disco(self, *argc, **kwargs) -> None:
-        self._process_message(
-            *argc,
-            **kwargs,
-            protocol=dev.Protocol.Z2M,
-            message_type=messenger.MessageType.DISCO,
-        )
-
-    def _on_tasmota_disco(self, *argc, **kwargs) -> None:
-        self._process_message(
-            *argc,
-            **kwargs,
-            protocol=dev.Protocol.TASMOTA,
-            message_type=messenger.MessageType.DISCO,
-        )
+        try:
+            self._output_queue.put(_incoming, block=True, timeout=self._queue_timeout)
+        except Full:
+            utils.i2m_log.warning(
+                "Queue full, message dismissed - topic: %s", mqtt_message.topic
+            )
 
     def _on_connect(  # pylint: disable=too-many-arguments
         self,
@@ -434,21 +430,38 @@ class Scrutinizer:
         reason_code: mqtt.ReasonCode,  # pylint: disable=unused-argument
         properties: mqtt.Properties,  # pylint: disable=unused-argument
     ) -> None:
-        """Subscribes to MQTT topics on connection."""
-        for _topic in _InfoTopicManager().get_all_topics_to_subscribe():
-            utils.i2m_log.debug("Subscribing to %s", _topic)
-            client.subscribe(_topic)
+        """Subscribes to MQTT topics on connection, in a single SUBSCRIBE packet."""
+        _topics = [
+            (_topic, 0) for _topic in _info_topic_manager.get_all_topics_to_subscribe()
+        ]
+        utils.i2m_log.debug("Subscribing to %s", _topics)
+        client.subscribe(_topics)
 
 
 class _TimerManager:
     """
     A class to manage timers for devices, ensuring thread safety and preventing multiple timers
     from being active for the same device in case of bouncing messages
+
+    All timers are served by a single scheduler thread: pending timers are kept in a
+    min-heap ordered by deadline, and a timer replaced for the same device is left in
+    the heap as a stale entry that is skipped when it pops out. Tasks run one after the
+    other on the scheduler thread, they are expected to be short (e.g. an MQTT publish).
+
+    The scheduler is not a daemon thread: as with one threading.Timer per timer, the
+    interpreter waits for the pending timers (e.g. an automatic switch off) to fire
+    before exiting. The thread ends once no timer is pending and is started again by
+    the next create_timer call.
     """
 
     def __init__(self):
-        self._timer_registry: Dict[str, threading.Thread] = {}
-        self._timer_registry_lock = threading.Lock()
+        # Heap entries: (deadline, sequence, device_name, task, args, kwargs)
+        self._timer_heap: List[tuple] = []
+        # Sequence number of the active timer of each device
+        self._timer_registry: Dict[str, int] = {}
+        self._timer_registry_lock = threading.Condition()
+        self._timer_sequence = itertools.count()
+        self._scheduler: Optional[threading.Thread] = None
 
     def create_timer(
         self,
@@ -457,14 +470,14 @@ class _TimerManager:
         task: Callable[..., Any],
         args: tuple = (),
         kwargs: Optional[Dict[str, Any]] = None,
-    ) -> threading.Thread:
+    ) -> None:
         """
         Manages a timer for a specific device, ensuring that only one timer is active per device.
 
-        This method creates and starts a new timer for the given device. If a timer for the device
-        already exists, it cancels the existing timer before starting a new one. The timer will call
-        the specified function (`task`) with the provided arguments (`args` and `kwargs`) after
-        the countdown period.
+        This method schedules a new timer for the given device. If a timer for the device
+        already exists, it cancels the existing timer before scheduling the new one. The timer
+        will call the specified function (`task`) with the provided arguments (`args` and
+        `kwargs`) after the countdown period.
 
         Args:
             device_name (str): The name of the device for which the timer is being managed.
@@ -475,29 +488,66 @@ class _TimerManager:
                 Defaults to ().
             kwargs (Optional[Dict[str, Any]], optional): Keyword arguments to be passed to the
                 `task` function. Defaults to None.
-
-        Returns:
-            threading.Thread: The newly created and started timer thread.
         """
         if kwargs is None:
             kwargs = {}
-        try:
-            with self._timer_registry_lock:
-                _previous_timer = self._timer_registry.get(device_name)
-                if _previous_timer is not None:
-                    utils.i2m_log.debug("Replace previous timer for %s", device_name)
-                    _previous_timer.cancel()
-                _timer = threading.Timer(countdown, task, args=args, kwargs=kwargs)
-                _timer.start()
-                self._timer_registry[device_name] = _timer
-        except Exception as e:
-            utils.i2m_log.error(
-                "Failed to manage timer for %s: %s", device_name, str(e)
+        _deadline = time.monotonic() + countdown
+        with self._timer_registry_lock:
+            if device_name in self._timer_registry:
+                utils.i2m_log.debug("Replace previous timer for %s", device_name)
+            _sequence = next(self._timer_sequence)
+            self._timer_registry[device_name] = _sequence
+            heapq.heappush(
+                self._timer_heap,
+                (_deadline, _sequence, device_name, task, args, kwargs),
             )
-            raise
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(
+                    target=self._run_scheduler, name="TimerManager"
+                )
+                self._scheduler.start()
+            self._timer_registry_lock.notify()
+
+    def _next_due_timer(self) -> Optional[tuple]:
+        # Block until the earliest active timer is due, then pop it. None when no timer is
+        # pending, the scheduler is then released so that it does not hold the interpreter
+        with self._timer_registry_lock:
+            while True:
+                if not self._timer_registry:
+                    # Only stale entries are left, if any
+                    self._timer_heap.clear()
+                    self._scheduler = None
+                    return None
+                _entry = self._timer_heap[0]
+                _delay = _entry[0] - time.monotonic()
+                if _delay > 0:
+                    self._timer_registry_lock.wait(_delay)
+                    continue
+                heapq.heappop(self._timer_heap)
+                _device_name = _entry[2]
+                if self._timer_registry.get(_device_name) != _entry[1]:
+                    # Cancelled: a newer timer was created for the same device
+                    continue
+                del self._timer_registry[_device_name]
+                return _entry
+
+    def _run_scheduler(self) -> None:
+        while True:
+            _entry = self._next_due_timer()
+            if _entry is None:
+                return
+            _, _, _device_name, _task, _args, _kwargs = _entry
+            # The task runs outside the lock, it may create a new timer
+            try:
+                _task(*_args, **_kwargs)
+            except Exception as e:  # pylint: disable=broad-except
+                utils.i2m_log.error(
+                    "Timer task failed for %s: %s", _device_name, str(e)
+                )
 
 
 _timer_manager = _TimerManager()
+_DISCOVERY_TIMER = "<discovery>"  # Timer key, not a valid device name
 
 
 class DeviceAccessor:
@@ -541,7 +591,7 @@ class DeviceAccessor:
             If the encoder for the given device model is not found, a debug message is logged
             and the method returns without publishing any messages.
         """
-        _command_base_topic = _CommandTopicManager().get_command_base_topic(protocol)
+        _command_base_topic = _command_topic_manager.get_command_base_topic(protocol)
         _encoder = encoder.EncoderRegistry.get_encoder(model=model)
         if _encoder is None:
             utils.i2m_log.debug("Cannot get state for model: %s", model)
@@ -549,8 +599,7 @@ class DeviceAccessor:
         _fields = _encoder.gettable_fields
         if protocol == dev.Protocol.Z2M:
             _command_topic = f"{_command_base_topic}/{device_name}/get"
-            _pl = {_field: "" for _field in _fields}
-            _command_payload = json.dumps(_pl)
+            _command_payload = _z2m_get_payload(tuple(_fields))
             utils.i2m_log.debug(
                 "Publishing state retrieval to %s - state : %s",
                 _command_topic,
@@ -561,16 +610,19 @@ class DeviceAccessor:
             )
             return
         if protocol == dev.Protocol.TASMOTA:
-            for _field in _fields:
-                _command_topic = f"{_command_base_topic}/{device_name}/{_field}"
-                utils.i2m_log.debug(
-                    "Publishing state retrieval to %s - state : %s",
-                    _command_topic,
-                    '""',
-                )
-                self._mqtt_client.publish(
-                    _command_topic, payload="", qos=1, retain=False
-                )
+            if not _fields:
+                return
+            _command_topic, _command_payload = _tasmota_command(
+                _command_base_topic, device_name, dict.fromkeys(_fields, "")
+            )
+            utils.i2m_log.debug(
+                "Publishing state retrieval to %s - state : %s",
+                _command_topic,
+                _command_payload,
+            )
+            self._mqtt_client.publish(
+                _command_topic, payload=_command_payload, qos=1, retain=False
+            )
             return
         _error_msg = f"Unknown protocol {protocol}"
         raise NotImplementedError(_error_msg)
@@ -591,9 +643,10 @@ class DeviceAccessor:
             by the use of the `model_dump` method.
 
         """
-        _command_base_topic = _CommandTopicManager().get_command_base_topic(protocol)
-        _json_state = json.dumps(state)
+        _command_base_topic = _command_topic_manager.get_command_base_topic(protocol)
         if protocol == dev.Protocol.Z2M:
+            # State keys may be str subclasses such as abstract.Attr members
+            _json_state = orjson.dumps(state, option=orjson.OPT_NON_STR_KEYS)
             _command_topic = f"{_command_base_topic}/{device_name}/set"
             utils.i2m_log.debug(
                 "Publishing state change to %s - state : %s",
@@ -605,14 +658,19 @@ class DeviceAccessor:
             )
             return
         if protocol == dev.Protocol.TASMOTA:
-            for _key, _value in state.items():
-                _command_topic = f"{_command_base_topic}/{device_name}/{_key}"
-                utils.i2m_log.debug(
-                    "Publishing state change to %s - state : %s", _command_topic, _value
-                )
-                self._mqtt_client.publish(
-                    _command_topic, payload=str(_value), qos=1, retain=False
-                )
+            if not state:
+                return
+            _command_topic, _command_payload = _tasmota_command(
+                _command_base_topic, device_name, state
+            )
+            utils.i2m_log.debug(
+                "Publishing state change to %s - state : %s",
+                _command_topic,
+                _command_payload,
+            )
+            self._mqtt_client.publish(
+                _command_topic, payload=_command_payload, qos=1, retain=False
+            )
             return
         _error_msg = f"Unknown protocol {protocol}"
         raise NotImplementedError(_error_msg)
@@ -808,70 +866,108 @@ def get_refined_data_queue(mqtt_client: mqtthelper.ClientHelper) -> Queue:
         Queue: The queue containing the refined (processed) messages.
 
     """
-    _raw_data_queue = Queue()
-    _layer1_queue = Queue()
-    _layer2_queue = Queue()
+    # Bounded internal hops: a stalled stage blocks the previous one, down to Scrutinizer.
+    # The returned queue stays unbounded, callers may never read it.
+    _raw_data_queue = Queue(maxsize=QUEUE_MAX_SIZE)
+    _layer1_queue = Queue(maxsize=QUEUE_MAX_SIZE)
     _refined_queue = Queue()
     Scrutinizer(mqtt_client=mqtt_client, output_queue=_raw_data_queue)
 
+    _discovery_done = threading.Event()
     messenger.Dispatcher(
         name="pipeline-discovery",
         input_queue=_raw_data_queue,
         output_queue=_layer1_queue,
         conditional_handlers=[
-            (messenger.is_type_discovery, processor.Discoverer().process),
+            (
+                messenger.is_type_discovery,
+                partial(
+                    _discover,
+                    discoverer=processor.Discoverer(),
+                    discovery_done=_discovery_done,
+                ),
+            ),
         ],
         # copy Discovery message to output queue
         default_handler=processor.Processor.pass_through,
     )
-    time.sleep(2)  # Listen to receive all discovery messages
+    # Listen to receive all discovery messages, until they stop coming in
+    _discovery_done.wait(timeout=DISCOVERY_TIMEOUT)
     _accessor = DeviceAccessor(mqtt_client=mqtt_client)
+    _model_resolver = processor.ModelResolver()
+    # Model resolution and normalization run back to back in a single stage
     messenger.Dispatcher(
-        name="pipeline-layer1",
+        name="pipeline-normalizer",
         input_queue=_layer1_queue,
-        output_queue=_layer2_queue,
-        conditional_handlers=[
-            (
-                lambda msg: not messenger.is_type_discovery(msg),
-                processor.ModelResolver().process,
-            ),
-        ],
-        # copy Discovery message to output queue
-        default_handler=lambda msg: _get_device_state(msg, _accessor),
-    )
-    messenger.Dispatcher(
-        name="normalizer",
-        input_queue=_layer2_queue,
         output_queue=_refined_queue,
         conditional_handlers=[
             (
                 messenger.is_type_availability,
-                processor.AvailabilityNormalizer().process,
+                partial(
+                    _resolve_and_normalize,
+                    resolver=_model_resolver,
+                    normalizer=processor.AvailabilityNormalizer(),
+                ),
             ),
             (
                 messenger.is_type_state,
-                processor.StateNormalizer().process,
+                partial(
+                    _resolve_and_normalize,
+                    resolver=_model_resolver,
+                    normalizer=processor.StateNormalizer(),
+                ),
             ),
         ],
-        # copy Discovery message to output queue
-        default_handler=processor.Processor.pass_through,
+        # Trigger state retrieval of discovered devices and copy to output queue
+        default_handler=partial(_get_device_state, accessor=_accessor),
     )
     return _refined_queue
 
 
+def _discover(
+    message: messenger.Message,
+    discoverer: processor.Discoverer,
+    discovery_done: threading.Event,
+) -> Optional[messenger.Message]:
+    _result = discoverer.process(message)
+    # Discovery is deemed complete once no discovery message came in for a while
+    _timer_manager.create_timer(
+        device_name=_DISCOVERY_TIMER,
+        countdown=DISCOVERY_QUIET_TIME,
+        task=discovery_done.set,
+    )
+    return _result
+
+
+def _resolve_and_normalize(
+    message: messenger.Message,
+    resolver: processor.ModelResolver,
+    normalizer: processor.Processor,
+) -> Optional[messenger.Message]:
+    try:
+        return normalizer.process(resolver.process(message))
+    except processor.DecodingException as exc:
+        # A malformed message must not stop the stage serving all the devices
+        utils.i2m_log.warning("[%s] Message dismissed: %s", message.device_name, exc)
+        return None
+
+
 def _get_device_state(
     message: messenger.Message, accessor: DeviceAccessor
 ) -> Optional[messenger.Message]:
     _registry = message.refined
-    for _device_name in _registry.device_names:
+    # Each device is queried once, even if listed several times
+    for _device_name in dict.fromkeys(_registry.device_names):
         _device: Optional[dev.Device] = processor.DeviceDirectory.get_device(
             _device_name
         )
-        _model = _device.model
-        _protocol = _device.protocol
-        accessor.trigger_get_state(_device_name, protocol=_protocol, model=_model)
+        if _device is None:
+            continue
+        accessor.trigger_get_state(
+            _device_name, protocol=_device.protocol, model=_device.model
+        )
     return message
 
 
-_InfoTopicManager().configure_topic_registry()
-_CommandTopicManager().configure_topic_registry()
+_info_topic_manager.configure_topic_registry()
+_command_topic_manager.configure_topic_registry()
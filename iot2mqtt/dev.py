@@ -15,14 +15,14 @@ Classes and Enums
 
 """
 
+from dataclasses import dataclass
 from enum import Enum
 from threading import Lock
 from typing import Dict, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
 
-
-class Model(BaseModel, frozen=True):
+@dataclass(frozen=True, slots=True)
+class Model:
     """
     Represents a model of an IoT device.
 
@@ -30,7 +30,7 @@ class Model(BaseModel, frozen=True):
         tag (str): The tag associated with the device model.
     """
 
-    tag: str = Field(frozen=True)
+    tag: str
 
 
 class ModelFactory:
@@ -61,7 +61,10 @@ class ModelFactory:
             Model: The Model instance associated with the given tag, or a new instance if the
             tag does not exist.
         """
-
+        # Known tags are served without locking, the lock only guards creation
+        _model_instance = cls._model_instances.get(tag)
+        if _model_instance is not None:
+            return _model_instance
         with cls._lock:
             if tag in cls._model_instances:
                 return cls._model_instances[tag]
@@ -95,8 +98,13 @@ class Protocol(Enum):
     Z2M = "Zigbee2MQTT"
     Z2T = "Zigbee2Tasmota"
 
+    # Members are singletons: identity hashing is consistent with equality and,
+    # unlike Enum.__hash__, does not run Python code on each registry lookup
+    __hash__ = object.__hash__
 
-class Device(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class Device:
     """
     Represents a generic IoT device in the system.
 
@@ -104,19 +112,20 @@ class Device(BaseModel):
     and methods that all devices should have. Specific device types should inherit from this class
     and add their own unique properties and methods.
 
+    Devices are immutable value objects built by the discovery from trusted data, their
+    attributes are not validated.
+
     Attributes:
-        name (str): The human-readable name of the device. This field is immutable.
-        protocol (Protocol): The communication protocol used by the device. This field is immutable.
+        name (str): The human-readable name of the device.
+        protocol (Protocol): The communication protocol used by the device.
         address (Optional[str]): The network address of the device. Defaults to None.
         model (Optional[Model]): The model of the device. Defaults to None.
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    name: str = (Field(frozen=True),)
-    protocol: Protocol = (Field(frozen=True),)
-    address: Optional[str] = (None,)
-    model: Optional[Model] = (None,)
+    name: str
+    protocol: Protocol
+    address: Optional[str] = None
+    model: Optional[Model] = None
 
 
 class ButtonAction(Enum):
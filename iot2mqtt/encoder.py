@@ -43,23 +43,63 @@ Here is an example of how to use the encoder module to encode a device state:
         main()
 """
 
-from typing import Any, Callable, Dict, List, Optional
+from dataclasses import field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, get_args
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ValidationError
+from pydantic.dataclasses import dataclass
 
 from iot2mqtt import abstract, dev, utils
 
 
-class Encoder(BaseModel):
+def _contains_model(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_contains_model(_arg) for _arg in get_args(annotation))
+
+
+@lru_cache(maxsize=None)
+def _is_flat_state(state_class: Type[abstract.DeviceState]) -> bool:
+    """
+    Tell whether the fields of a state can be read from its instance dictionary.
+
+    This holds when the state class has no computed field, no excluded field and no
+    nested model: dumping it then only yields its own field values.
+
+    Args:
+        state_class (Type[abstract.DeviceState]): The state class to inspect.
+
+    Returns:
+        bool: True if ``model_dump`` can be bypassed for the states of this class.
+    """
+    if state_class.model_computed_fields:
+        return False
+    return not any(
+        _field.exclude or _contains_model(_field.annotation)
+        for _field in state_class.model_fields.values()
+    )
+
+
+# Encoding plan of a flat state class: (field name, encoded key, converter) triples
+_EncodingPlan = Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Encoder:
     """
     Encoder class for transforming and validating device states.
+
+    The aliases and converters are resolved once per state class into an encoding
+    plan, which is then applied to each state of that class.
     """
 
-    settable_fields: List[str] = Field(frozen=True)
-    gettable_fields: List[str] = Field(frozen=True)
-    field_aliases: Optional[Dict[str, str]] = Field(default=None, frozen=True)
-    field_converters: Optional[Dict[str, Callable[[Any], Any]]] = Field(
-        default=None, frozen=True
+    settable_fields: List[str]
+    gettable_fields: List[str]
+    field_aliases: Optional[Dict[str, str]] = None
+    field_converters: Optional[Dict[str, Callable[[Any], Any]]] = None
+    _plans: Dict[type, Optional[_EncodingPlan]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
     )
 
     def __repr__(self):
@@ -69,6 +109,19 @@ class Encoder(BaseModel):
             f", converter={self.field_converters})"
         )
 
+    def _build_plan(
+        self, state_class: Type[abstract.DeviceState]
+    ) -> Optional[_EncodingPlan]:
+        # No plan for states that must go through model_dump
+        if not _is_flat_state(state_class):
+            return None
+        _aliases = self.field_aliases or {}
+        _converters = self.field_converters or {}
+        return tuple(
+            (_name, _aliases.get(_name, _name), _converters.get(_name))
+            for _name in state_class.model_fields
+        )
+
     def transform(self, state: abstract.DeviceState) -> Dict:
         """
         Transforms the given device state into an encoded dictionary.
@@ -79,20 +132,28 @@ class Encoder(BaseModel):
         Returns:
             Dict: The encoded state of the device as a dictionary.
         """
+        _state_class = type(state)
+        try:
+            _plan = self._plans[_state_class]
+        except KeyError:
+            _plan = self._plans[_state_class] = self._build_plan(_state_class)
         _encoded_state = {}
-        for key, value in state.model_dump(exclude_none=True).items():
-            _alias = self.field_aliases.get(key) if self.field_aliases else None
-            _converter = (
-                self.field_converters.get(key) if self.field_converters else None
-            )
-            if _converter is None:
-                transformed_value = value
-            else:
-                transformed_value = _converter(value)
-            if _alias is None:
-                _encoded_state[key] = transformed_value
-            else:
-                _encoded_state[_alias] = transformed_value
+        if _plan is None:
+            _aliases = self.field_aliases or {}
+            _converters = self.field_converters or {}
+            for key, value in state.model_dump(exclude_none=True).items():
+                _converter = _converters.get(key)
+                _encoded_state[_aliases.get(key, key)] = (
+                    value if _converter is None else _converter(value)
+                )
+            return _encoded_state
+        _values = state.__dict__
+        for _name, _key, _converter in _plan:
+            _value = _values.get(_name)
+            if _value is not None:
+                _encoded_state[_key] = (
+                    _value if _converter is None else _converter(_value)
+                )
         return _encoded_state
 
 
@@ -173,9 +234,13 @@ def encode(model: dev.Model, state: abstract.DeviceState) -> Dict[str, Any]:
         Dict[str, Any]: The encoded state of the device as a dictionary. If no encoder is found,
         the state is returned as a dictionary without transformation.
 
+    Raises:
+        TypeError: If the model or the state is not of the expected type, unless Python
+            runs with optimizations enabled.
     """
-    utils.check_parameter("model", model, dev.Model)
-    utils.check_parameter("state", state, abstract.DeviceState)
+    if __debug__:
+        utils.check_parameter("model", model, dev.Model)
+        utils.check_parameter("state", state, abstract.DeviceState)
 
     _encoder = EncoderRegistry.get_encoder(model=model)
     if _encoder is None:
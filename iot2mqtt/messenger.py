@@ -71,11 +71,14 @@ dispatcher according to their message type:
 import enum
 import queue
 import threading
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable, Dict, List, Optional, Tuple, TypeAlias, Union
+from logging import DEBUG
+from typing import (Annotated, Callable, Dict, List, Optional, Tuple,
+                    TypeAlias, Union)
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny
+from pydantic import Field, SerializeAsAny, TypeAdapter
 
 from iot2mqtt import dev, utils
 
@@ -89,11 +92,15 @@ class MessageType(enum.Enum):
     AVAIL = "availability"
     STATE = "state"
 
+    # Members are singletons, see dev.Protocol
+    __hash__ = object.__hash__
+
     def __str__(self) -> str:
         return self.value
 
 
-class Item(BaseModel):
+@dataclass(slots=True)
+class Item:
     """
     Represents a raw data item in the IoT system.
 
@@ -108,10 +115,14 @@ class Item(BaseModel):
     tag: Optional[str] = None
 
 
-class Message(BaseModel):
+@dataclass(slots=True)
+class Message:
     """
     Represents a message in the IoT system.
 
+    Messages are created for each incoming MQTT message from trusted internal code,
+    they are thus plain dataclasses and their attributes are not validated.
+
     Attributes:
         protocol (dev.Protocol): The communication protocol used by the device.
         model (Optional[dev.Model]): The model of the device, if available.
@@ -119,32 +130,71 @@ class Message(BaseModel):
         message_type (MessageType): The type of the message (e.g., discovery,
             availability, state).
         raw_item (Item): The raw data item associated with the message.
-        id (UUID): A unique identifier for the message, generated by default.
+        id (UUID): A unique identifier for the message, generated on first access.
         refined (Optional[Item]): An optional refined version of the raw item.
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     protocol: dev.Protocol
     model: Optional[dev.Model]
     device_name: str
     message_type: MessageType
     raw_item: Item
-    id: UUID = Field(default_factory=uuid4)
+    # Generated on first access, most messages are never identified
+    _id: Annotated[Optional[UUID], Field(serialization_alias="id")] = field(
+        default=None, init=False, repr=False
+    )
     refined: SerializeAsAny[Optional[Item]] = None
 
+    @property
+    def id(self) -> UUID:
+        """
+        The unique identifier of the message, generated on first access.
+
+        Returns:
+            UUID: The identifier of the message.
+        """
+        if self._id is None:
+            self._id = uuid4()
+        return self._id
+
+    def model_dump_json(self, indent: Optional[int] = None) -> str:
+        """
+        Serialize the message to JSON.
+
+        Args:
+            indent (Optional[int]): The indentation of the JSON output, compact if None.
+
+        Returns:
+            str: The JSON representation of the message.
+        """
+        _ = self.id  # Generate the identifier before it is serialized
+        return _MESSAGE_ADAPTER.dump_json(self, indent=indent, by_alias=True).decode(
+            "utf-8"
+        )
+
 
-# Class predicate definition
+_MESSAGE_ADAPTER = TypeAdapter(Message)
+
+
+# Class predicate definition, MessageType members are singletons so identity compare is valid
 def is_type_discovery(msg: Message) -> bool:
-    return msg.message_type == MessageType.DISCO
+    return msg.message_type is MessageType.DISCO
 
 
 def is_type_availability(msg: Message) -> bool:
-    return msg.message_type == MessageType.AVAIL
+    return msg.message_type is MessageType.AVAIL
 
 
 def is_type_state(msg: Message) -> bool:
-    return msg.message_type == MessageType.STATE
+    return msg.message_type is MessageType.STATE
+
+
+# Message type tested by each built-in predicate, used to dispatch by lookup
+_TYPE_PREDICATES: Dict[Callable[[Message], bool], MessageType] = {
+    is_type_discovery: MessageType.DISCO,
+    is_type_availability: MessageType.AVAIL,
+    is_type_state: MessageType.STATE,
+}
 
 
 class QueueManager:
@@ -213,16 +263,28 @@ class Dispatcher(QueueManager):
         conditional_handlers (ConditionalProcessingList): A list of tuples where each tuple
             contains a condition function and a handler function.
         default_handler (Optional[Handler]): A default handler function to process messages
-            that do not match any condition. Defaults to None.
+            that do not match any condition. Defaults to None, where such messages are
+            dropped.
         name (Optional[str]): An optional name for the dispatcher. If not provided, a default
             name is generated.
+        strict (bool): When True, every condition is evaluated and a warning is logged for
+            each message matching more than one of them. Defaults to False, where the first
+            matching condition wins.
 
     Attributes:
         STOP (str): Sentinel value used to signal the dispatcher to stop processing messages.
+        HIGH_WATERMARK_RATIO (float): Fill ratio of a bounded output queue above which a
+            warning is logged.
+        MAX_BATCH (int): Maximum number of messages taken from the input queue at once.
+        POLL_INTERVAL (float): Maximum time in seconds an idle dispatcher waits for a message
+            before checking whether it was forcefully stopped.
 
     """
 
     STOP = "STOP"
+    HIGH_WATERMARK_RATIO = 0.8
+    MAX_BATCH = 64
+    POLL_INTERVAL = 1.0
     _instance_nb = 0
     _instance_nb_lock = threading.Lock()
 
@@ -233,19 +295,28 @@ class Dispatcher(QueueManager):
         conditional_handlers: ConditionalProcessingList,
         default_handler: Optional[Handler] = None,
         name: Optional[str] = None,
+        strict: bool = False,
     ) -> None:
         super().__init__(input_queue, output_queue)
         with Dispatcher._instance_nb_lock:
             self.name = name or f"Dispatcher#{Dispatcher._instance_nb}"
             Dispatcher._instance_nb += 1
         self.conditional_handlers = conditional_handlers
-        self._default_handler = default_handler or self._no_handler
+        self._default_handler = default_handler
+        self._strict = strict
+        self._type_table = self._build_type_table(conditional_handlers)
         self._thread = threading.Thread(target=self._run, daemon=True)
-        self._stop_event = threading.Event()  # Use an event for stopping
+        self._stop_event = threading.Event()  # Set by force_stop
+        # Warn once each time a bounded output queue gets close to full, sinks that only
+        # provide put() are not watched
+        _maxsize = getattr(output_queue, "maxsize", 0)
+        self._high_watermark = int(_maxsize * self.HIGH_WATERMARK_RATIO) or None
+        self._congested = False
         self._thread.start()
-        utils.i2m_log.debug(
-            "[%s] Dispatcher started at %s", self.name, datetime.now().isoformat()
-        )
+        if utils.i2m_log.isEnabledFor(DEBUG):
+            utils.i2m_log.debug(
+                "[%s] Dispatcher started at %s", self.name, datetime.now().isoformat()
+            )
 
     def __str__(self) -> str:
         conditional_handlers_count = (
@@ -258,13 +329,36 @@ class Dispatcher(QueueManager):
             f"output_queue_size={self._output_queue.qsize() if self._output_queue else 'N/A'})"
         )
 
-    def _no_handler(self, message: Message) -> Optional[Message]:
-        utils.i2m_log.debug(
-            "No handler set for message with ID: %s, Device: %s, Type: %s",
-            message.id,
-            message.device_name,
-            message.message_type,
-        )
+    def _build_type_table(
+        self, conditional_handlers: ConditionalProcessingList
+    ) -> Optional[Dict[MessageType, Handler]]:
+        """
+        Builds a message type to handler table when every condition is a type predicate.
+
+        Args:
+            conditional_handlers (ConditionalProcessingList): The conditional handlers.
+
+        Returns:
+            Optional[Dict[MessageType, Handler]]: The dispatch table, or None when a condition
+            is not one of the ``is_type_*`` predicates, or when two conditions test the same
+            type in strict mode.
+        """
+        _table = {}
+        for _condition, _handler in conditional_handlers or ():
+            _message_type = _TYPE_PREDICATES.get(_condition)
+            if _message_type is None:
+                return None
+            if _message_type in _table:
+                if self._strict:
+                    return None
+                utils.i2m_log.warning(
+                    "[%s] Duplicate condition for %s messages ignored",
+                    self.name,
+                    _message_type,
+                )
+                continue
+            _table[_message_type] = _handler
+        return _table
 
     def _process_and_put(self, handler: Handler, message: Message) -> None:
         """
@@ -282,8 +376,85 @@ class Dispatcher(QueueManager):
             return
         if _result is None:
             return
+        if self._high_watermark is not None:
+            self._check_congestion()
         self._output_queue.put(_result)
 
+    def _check_congestion(self) -> None:
+        _size = self._output_queue.qsize()
+        if _size > self._high_watermark:
+            if not self._congested:
+                utils.i2m_log.warning(
+                    "[%s] Output queue filling up: %s messages pending",
+                    self.name,
+                    _size,
+                )
+            self._congested = True
+        else:
+            self._congested = False
+
+    def _dispatch(self, message: Message) -> None:
+        """
+        Processes a message with the first matching conditional handler, or the default one.
+
+        In strict mode, the remaining conditions are still evaluated to warn about messages
+        matching more than one of them.
+
+        Args:
+            message (Message): The message to be processed.
+
+        Returns:
+            None
+        """
+        _found = False
+        for _condition, _handler in self.conditional_handlers:
+            if _condition(message):
+                if not self._strict:
+                    self._process_and_put(_handler, message)
+                    return
+                if _found:
+                    utils.i2m_log.warning(
+                        "[%s: Ignored] Id: %s - Device: %s - Type : %s - Refined: %s",
+                        self.name,
+                        message.id,
+                        message.device_name,
+                        message.message_type,
+                        message.refined,
+                    )
+                    break
+                _found = True
+                self._process_and_put(_handler, message)
+
+        if not _found and self._default_handler is not None:
+            self._process_and_put(self._default_handler, message)
+
+    def _drain(self) -> List:
+        """
+        Waits for a message and takes the ones already pending in the input queue along.
+
+        Up to MAX_BATCH messages are taken, in the order the input queue hands them out.
+        Draining ends at STOP, the messages behind it are left in the input queue.
+
+        Returns:
+            List: The messages taken from the input queue, empty when none came in within
+            POLL_INTERVAL.
+        """
+        try:
+            # Bounded wait so that an idle dispatcher notices force_stop
+            _message = self._input_queue.get(timeout=self.POLL_INTERVAL)
+        except queue.Empty:
+            return []
+        _batch = [_message]
+        _get_nowait = self._input_queue.get_nowait
+        _stop = self.STOP
+        while _message != _stop and len(_batch) < self.MAX_BATCH:
+            try:
+                _message = _get_nowait()
+            except queue.Empty:
+                break
+            _batch.append(_message)
+        return _batch
+
     def _run(self) -> None:
         """
         The main loop that processes messages from the input queue based on conditional handlers.
@@ -292,54 +463,73 @@ class Dispatcher(QueueManager):
         queue.
         It checks each message against the conditional handlers and processes it using the first
         matching handler.
-        If no handlers match, the default handler is used. The loop stops when the stop event is
-        set or a STOP message is received.
+        If no handlers match, the default handler is used. The loop stops when a STOP message is
+        received, or after the current batch once the stop event is set.
 
         Returns:
             None
         """
-        while not self._stop_event.is_set():
-            try:
-                _message = self._input_queue.get(
-                    timeout=1
-                )  # Use timeout to periodically check the stop event
-            except queue.Empty:
-                continue
-
-            if _message == self.STOP:
-                utils.i2m_log.debug("[%s] Dispatcher stopped", self.name)
-                break
-
-            if _message is None:
-                utils.i2m_log.error("Message is None")
-                continue
-
-            _found = False
-            try:
-                for _condition, _handler in self.conditional_handlers:
-                    if _condition(_message):
-                        if _found:
-                            utils.i2m_log.warning(
-                                "[%s: Ignored] Id: %s - Device: %s - Type : %s - Refined: %s",
-                                self.name,
-                                _message.id,
-                                _message.device_name,
-                                _message.message_type,
-                                _message.refined,
-                            )
-                            break
-                        _found = True
-                        self._process_and_put(_handler, _message)
-
-                if not _found:
-                    self._process_and_put(self._default_handler, _message)
-            except TypeError as e:
-                utils.i2m_log.error(
-                    "Exception evaluating conditional handler handler: %s",
-                    e,
-                    exc_info=True,
-                )
-            self._input_queue.task_done()
+        _task_done = self._input_queue.task_done
+        # Loop invariants bound once to locals
+        _drain = self._drain
+        _stop = self.STOP
+        _type_table = self._type_table
+        _default_handler = self._default_handler
+        _dispatch = self._dispatch
+        # Terminal dispatchers drop the results
+        _put = (
+            self._output_queue.put
+            if self._output_queue is not None
+            else lambda _result: None
+        )
+        _watched = self._high_watermark is not None
+        _stopped = self._stop_event.is_set
+        while not _stopped():
+            _batch = _drain()
+            for _index, _message in enumerate(_batch):
+                try:
+                    if _message == _stop:
+                        utils.i2m_log.debug("[%s] Dispatcher stopped", self.name)
+                        return
+
+                    if _message is None:
+                        utils.i2m_log.error("Message is None")
+                        continue
+
+                    if _type_table is None:
+                        _dispatch(_message)
+                    else:
+                        # Only type predicates: a single lookup replaces the condition scan
+                        _handler = _type_table.get(
+                            _message.message_type, _default_handler
+                        )
+                        # Unmatched messages are dropped without a default handler
+                        _result = None if _handler is None else _handler(_message)
+                        if _result is not None:
+                            if _watched:
+                                self._check_congestion()
+                            _put(_result)
+                except TypeError as e:
+                    utils.i2m_log.error(
+                        "Exception evaluating conditional handler handler: %s",
+                        e,
+                        exc_info=True,
+                    )
+                except BaseException:
+                    # The dispatcher dies, the rest of the batch is dropped but still marked
+                    # done so that joining the input queue does not hang on it
+                    _dropped = len(_batch) - _index - 1
+                    for _ in range(_dropped):
+                        _task_done()
+                    if _dropped:
+                        utils.i2m_log.error(
+                            "[%s] Dispatcher failed, %s drained messages dropped",
+                            self.name,
+                            _dropped,
+                        )
+                    raise
+                finally:
+                    _task_done()
 
     def stop_loop(self) -> None:
         """Process all pending messages and stop the loop."""
@@ -351,16 +541,16 @@ class Dispatcher(QueueManager):
         """
         Forcefully stops the dispatcher by setting the stop event.
 
-        This method signals the dispatcher to stop processing messages by setting
-        the internal stop event. It is typically used to gracefully shut down the
-        dispatcher when it is no longer needed. Once the stop event is set, the
-        dispatcher will complete processing any current message and then exit its
-        run loop.
+        This method is typically used to shut down the dispatcher when it is no longer
+        needed, without waiting for the pending messages. The dispatcher completes the
+        batch it is processing (at most MAX_BATCH messages) and exits its run loop, within
+        POLL_INTERVAL when it is idle. Pending messages stay in the input queue. Nothing
+        is put in the input queue, so the caller never blocks.
 
         Logs a debug message indicating that the dispatcher has been forcefully stopped.
 
         Returns:
             None
         """
-        self._stop_event.set()  # Signal the stop event
+        self._stop_event.set()
         utils.i2m_log.debug("[%s] Dispatcher force stopped", self.name)
@@ -9,7 +9,8 @@ as well as client management for connecting, disconnecting, and handling MQTT ev
 """
 import dataclasses
 import socket
-import time
+import ssl
+from functools import lru_cache
 from typing import Any, Callable, List, Optional
 
 import certifi
@@ -18,7 +19,7 @@ import paho.mqtt.client as mqtt
 from iot2mqtt import utils
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MQTTContext:
     """
     MQTTContext holds the configuration for the MQTT client.
@@ -43,20 +44,20 @@ class MQTTContext:
     port: int = 1883
     keepalive: int = 60
     clean_start: bool = False
+    connected: bool = dataclasses.field(default=False, init=False)
+    started: bool = dataclasses.field(default=False, init=False)
+    loop_forever_used: bool = dataclasses.field(default=False, init=False)
 
     def __post_init__(self) -> None:
-        utils.check_parameter("client_id", self.client_id, str)
-        utils.check_parameter("hostname", self.hostname, str)
-        utils.check_parameter("port", self.port, int)
-        utils.check_parameter("keepalive", self.keepalive, int)
-        utils.check_parameter("clean_start", self.clean_start, bool)
+        if __debug__:
+            utils.check_parameter("client_id", self.client_id, str)
+            utils.check_parameter("hostname", self.hostname, str)
+            utils.check_parameter("port", self.port, int)
+            utils.check_parameter("keepalive", self.keepalive, int)
+            utils.check_parameter("clean_start", self.clean_start, bool)
 
-        self.connected = False
-        self.started = False
-        self.loop_forever_used = False
 
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SecurityContext:
     """
     SecurityContext holds the security-related configuration for the MQTT client.
@@ -73,11 +74,27 @@ class SecurityContext:
     user_pwd: Optional[str] = None
 
     def __post_init__(self) -> None:
-        utils.check_parameter("tls", self.tls, bool)
+        if __debug__:
+            utils.check_parameter("tls", self.tls, bool)
         # utils.check_parameter("user_name", self.user_name, str, optional=True)
         # utils.check_parameter("user_pwd", self.user_pwd, str, optional=True)
 
 
+@lru_cache(maxsize=None)
+def _certifi_ca_data() -> str:
+    """
+    Returns the certifi CA bundle, read once for all the clients.
+
+    Only the CA data is shared: each client builds its own TLS context, which paho
+    alters in place (e.g. tls_insecure_set).
+
+    Returns:
+        str: The PEM encoded CA certificates.
+    """
+    with open(certifi.where(), encoding="utf-8") as _file:
+        return _file.read()
+
+
 class ClientHelper(mqtt.Client):
     """
     ClientHelper is a helper class for managing MQTT client operations.
@@ -105,8 +122,9 @@ class ClientHelper(mqtt.Client):
         )
         if security_ctxt.tls:
             # enable TLS for secure connection
-            self.tls_set(certifi.where())
-        self.username_pw_set(security_ctxt.user_name, security_ctxt.user_pwd)
+            self.tls_set_context(ssl.create_default_context(cadata=_certifi_ca_data()))
+        if security_ctxt.user_name is not None or security_ctxt.user_pwd is not None:
+            self.username_pw_set(security_ctxt.user_name, security_ctxt.user_pwd)
 
         self._context = context
         self.on_connect_handlers: List[Callable[..., None]] = []
@@ -310,6 +328,9 @@ class MQTTClientDeprecated(ClientHelper):
         """
         Adds a callback function to the list of default message callbacks.
 
+        A single callback is set as paho on_message callback, so that it is called without
+        going through the callback list.
+
         Args:
             callback (Callable): The callback function to be added.
 
@@ -317,6 +338,11 @@ class MQTTClientDeprecated(ClientHelper):
             None
         """
         self._default_message_callbacks.append(callback)
+        self.on_message = (
+            callback
+            if len(self._default_message_callbacks) == 1
+            else self._handle_on_message_helper
+        )
 
     def publish_and_wait(
         self, topic: str, payload: str, timeout: float, **kwargs
@@ -334,27 +360,21 @@ class MQTTClientDeprecated(ClientHelper):
             mqtt.MQTTMessageInfo: Information about the published message.
 
         Raises:
-            ValueError: If any of the parameters are of incorrect type.
+            ValueError: If any of the parameters are of incorrect type, or if the message
+                was not queued because the outgoing queue is full.
+            RuntimeError: If the message could not be published, e.g. when not connected.
         """
-
-        def timed_out() -> bool:
-            return False if timeout_time is None else time.time() > timeout_time
-
         utils.check_parameter("topic", topic, str)
         utils.check_parameter("payload", payload, str)
         utils.check_parameter("timeout", timeout, (float, int))
 
-        timeout_time = None if timeout is None else time.time() + timeout
-        timeout_tenth = None if timeout is None else timeout / 10.0
-
         utils.i2m_log.warning(
             "Outgoing message on %s(%s) : %s", topic, type(payload), payload
         )
         _mi = self.publish(topic, payload, **kwargs)
-        if timeout is not None and not timed_out():
-            while not _mi.is_published():
-                utils.i2m_log.debug("Message is not yet published.")
-                time.sleep(timeout_tenth)
+        if timeout is not None:
+            # Block on the paho completion event instead of polling is_published()
+            _mi.wait_for_publish(timeout)
         return _mi
 
     def _handle_on_subscribe_helper(  # pylint: disable=too-many-arguments
@@ -366,12 +386,12 @@ class MQTTClientDeprecated(ClientHelper):
         properties: mqtt.Properties,
     ) -> None:
         """Define the default subscribtion callback implementation."""
-        for reason_code in reason_code_list:
-            if reason_code.is_failure:
-                utils.i2m_log.warning(
-                    "[%s] subscribe refused - reason code : %s", self, reason_code
-                )
-                return
+        _failure = next((_rc for _rc in reason_code_list if _rc.is_failure), None)
+        if _failure is not None:
+            utils.i2m_log.warning(
+                "[%s] subscribe refused - reason code : %s", self, _failure
+            )
+            return
         utils.i2m_log.debug("[%s] subscribe accepted", client)
         for on_subscribe_handler in self.on_subscribe_handlers:
             on_subscribe_handler(client, userdata, mid, reason_code_list, properties)
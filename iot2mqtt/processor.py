@@ -7,13 +7,20 @@ implementations for handling different types of messages and device protocols.
 
 """
 
+import time
 from abc import ABCMeta, abstractmethod
-from typing import Dict, List, Optional, Type
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type
 
 from pydantic import ValidationError
 
 from iot2mqtt import abstract, dev, messenger, utils
 
+# Aliases resolved once for the message processing hot path
+_DISCO = messenger.MessageType.DISCO
+_AVAIL = messenger.MessageType.AVAIL
+_STATE = messenger.MessageType.STATE
+
 
 class Processor(metaclass=ABCMeta):
     """
@@ -40,6 +47,24 @@ class Processor(metaclass=ABCMeta):
         return message
 
 
+@lru_cache(maxsize=128)
+def _parse_device_names(device_names: str) -> Optional[FrozenSet[str]]:
+    """
+    Parses a device names filter once, predicates are evaluated with the same filter for
+    every message.
+
+    Args:
+        device_names (str): The device name, a comma-separated list of device names
+            or `*` for all.
+
+    Returns:
+        Optional[FrozenSet[str]]: The device names, or None if all devices are selected.
+    """
+    if "*" in device_names:
+        return None
+    return frozenset(device_names.split(","))
+
+
 def _check_devices(msg: messenger.Message, device_names: str) -> bool:
     """
     Checks if the given message is for one of the specified device names.
@@ -52,22 +77,26 @@ def _check_devices(msg: messenger.Message, device_names: str) -> bool:
     Returns:
         bool: True if the message is for one of the specified device names, False otherwise.
     """
-    utils.check_parameter("device_names", device_names, str)
-    if "*" in device_names:
-        return True
-    device_name_list = device_names.split(",")
-    return msg.device_name in device_name_list
+    if __debug__:
+        utils.check_parameter("device_names", device_names, str)
+    _device_names = _parse_device_names(device_names)
+    return _device_names is None or msg.device_name in _device_names
+
+
+# States holding a switch power
+_SWITCH_TYPES = (abstract.Switch, abstract.Switch2Channels)
 
 
 def _check_message_typing(
     msg: messenger.Message, expected_type: Type[abstract.DeviceState]
 ) -> bool:
-    utils.check_parameter("msg", msg, messenger.Message)
-    if msg.refined is None:
-        return False
-    if not messenger.is_type_state(msg):
+    if __debug__:
+        utils.check_parameter("msg", msg, messenger.Message)
+    _refined = msg.refined
+    if _refined is None or msg.message_type is not _STATE:
         return False
-    if not isinstance(msg.refined, expected_type):
+    # isinstance() already returns at once for the exact class, the common case
+    if not isinstance(_refined, expected_type):
         raise TypeError(
             f"Message should refer to {expected_type}, got {msg.refined} of class {type(msg.refined).__name__}"
         )
@@ -108,7 +137,8 @@ def is_button_action_expected(
     Returns:
         bool: True if the message contains the specified button action, False otherwise.
     """
-    utils.check_parameter("action", action, abstract.ButtonValues)
+    if __debug__:
+        utils.check_parameter("action", action, abstract.ButtonValues)
     if _check_devices(msg, device_names) and _check_message_typing(
         msg, abstract.Button
     ):
@@ -131,11 +161,10 @@ def is_switch_power_expected(
     Returns:
         bool: True if the power status of the switch is as expected, False otherwise.
     """
-    utils.check_parameter("is_on", is_on, bool)
+    if __debug__:
+        utils.check_parameter("is_on", is_on, bool)
 
-    if _check_devices(msg, device_names) and _check_message_typing(
-        msg, (abstract.Switch, abstract.Switch2Channels)
-    ):
+    if _check_devices(msg, device_names) and _check_message_typing(msg, _SWITCH_TYPES):
         return msg.refined.power == abstract.POWER_ON if is_on else abstract.POWER_OFF
     return False
 
@@ -165,30 +194,81 @@ class MessageWritter(Processor):
     A processor that writes messages to a file.
 
     The `MessageWritter` class processes messages by writing them to a specified file in
-    JSON format. It ensures that the file is properly opened and closed.
+    JSON format. It ensures that the file is properly opened and closed. Writes are
+    buffered and flushed at most every FLUSH_INTERVAL seconds while messages keep coming,
+    the remaining buffered messages are written by `flush` or `close`. Used as a context
+    manager, the file is closed when the pipeline feeding it is shut down:
+
+        with MessageWritter("messages.json") as _writter:
+            ...  # run the dispatcher calling _writter.process, then stop it
+
+    Attributes:
+        BUFFER_SIZE (int): Size in bytes of the file buffer.
+        FLUSH_INTERVAL (float): Maximum time in seconds a message stays in the buffer
+            while messages keep coming.
     """
 
-    def __init__(self, file_name: str) -> None:
-        self._file = open(file_name, "w", encoding="utf-8")
+    BUFFER_SIZE = 65536
+    FLUSH_INTERVAL = 1.0
 
-    def process(self, message: messenger.Message) -> messenger.Message:
+    def __init__(self, file_name: str) -> None:
         """
         Initializes the MessageWritter with the specified file name.
 
         Args:
             file_name (str): The name of the file where messages will be written.
+        """
+        self._file = open(file_name, "wb", buffering=self.BUFFER_SIZE)
+        self._next_flush = time.monotonic() + self.FLUSH_INTERVAL
+
+    def process(self, message: messenger.Message) -> messenger.Message:
+        """
+        Writes the given message to the file in JSON format.
+
+        Args:
+            message (messenger.Message): The message to be written.
 
         Returns:
             None
         """
-        self._file.write("\n," + message.model_dump_json(indent=4))
-        self._file.flush()
+        self._file.write(("\n," + message.model_dump_json(indent=4)).encode("utf-8"))
+        _now = time.monotonic()
+        if _now >= self._next_flush:
+            self._file.flush()
+            self._next_flush = _now + self.FLUSH_INTERVAL
         return None
 
-    def __del__(self):
-        # Properly close file if an exception occures
+    def flush(self) -> None:
+        """
+        Writes the buffered messages to the file.
+
+        Returns:
+            None
+        """
+        self._file.flush()
+        self._next_flush = time.monotonic() + self.FLUSH_INTERVAL
+
+    def close(self) -> None:
+        """
+        Flushes the buffered messages and closes the file. Closing twice has no effect.
+
+        Returns:
+            None
+        """
         self._file.close()
 
+    def __enter__(self) -> "MessageWritter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __del__(self):
+        # Properly close file if an exception occures, flushing the buffered messages
+        _file = getattr(self, "_file", None)
+        if _file is not None:
+            _file.close()
+
 
 class ModelResolver(Processor):
     """
@@ -213,9 +293,8 @@ class ModelResolver(Processor):
             DecodingException: If a discovery message is received.
 
         """
-        if message.message_type == messenger.MessageType.DISCO:
-            _error_msg = f"Discovery message not allowed: {message}"
-            raise DecodingException(_error_msg)
+        if message.message_type is _DISCO:
+            raise DecodingException("Discovery message not allowed: %s", message)
         _device_name = message.device_name
         _device = Discoverer.directory.get_device(_device_name)
         message.model = _device.model if _device else dev.ModelFactory.UNKNOWN
@@ -308,80 +387,73 @@ class Discoverer(Processor):
 
         """
 
-        if message.message_type != messenger.MessageType.DISCO:
+        if message.message_type is not _DISCO:
             _error_msg = f"Not a discovery message: {message.message_type}"
             raise DecodingException(_error_msg)
-        if message.protocol == dev.Protocol.Z2M:
+        if message.protocol is dev.Protocol.Z2M:
             return self._discover_z2m(message)
-        if message.protocol == dev.Protocol.TASMOTA:
+        if message.protocol is dev.Protocol.TASMOTA:
             return self._discover_tasmota(message)
 
-        _error_msg = f"Unknown protocol: {message.protocol}"
-        utils.i2m_log.info(_error_msg)
+        utils.i2m_log.info("Unknown protocol: %s", message.protocol)
         return message
 
+    @staticmethod
+    def _get_z2m_model(entry: dict) -> str:
+        # Magic strings
+        NO_DEFINITION = "NO_DEFINITION"
+        NO_MODEL = "NO_MODEL"
+
+        _definition = entry.get("definition")
+        if not _definition:
+            utils.i2m_log.warning(
+                "[%s]: no 'definition' key in raw data : %s",
+                entry.get("friendly_name"),
+                entry,
+            )
+            return NO_DEFINITION
+        _model = _definition.get("model")
+        if not _model:
+            utils.i2m_log.warning(
+                "[%s]: no 'model' key in definition data: %s",
+                entry.get("friendly_name"),
+                _definition,
+            )
+            return NO_MODEL
+        return _model
+
     def _discover_z2m(self, message: messenger.Message) -> Optional[messenger.Message]:
         _key_name = "friendly_name"
         _key_address = "ieee_address"
-        _key_model = "model"
-        _key_definition = "definition"
         _key_type = "type"
-        _device_types = ["EndDevice", "Router"]
+        _device_types = frozenset(("EndDevice", "Router"))
         # Magic strings
-        NO_DEFINITION = "NO_DEFINITION"
-        NO_MODEL = "NO_MODEL"
         NO_FRIENDLY_NAME = "NO_FRIENDLY_NAME"
         NO_IEEE_ADDRESS = "NO_IEEE_ADDRESS"
 
-        def _device_dict(
-            raw_message: dict, device_type_list: List[str]
-        ) -> List[dev.Device]:
-            def _get_model(entry: dict) -> str:
-                _definition = entry.get(_key_definition)
-                if not _definition:
-                    utils.i2m_log.warning(
-                        "[%s]: no 'definition' key in raw data : %s",
-                        entry.get(_key_name),
-                        entry,
-                    )
-                    return NO_DEFINITION
-                _model = _definition.get(_key_model)
-                if not _model:
-                    utils.i2m_log.warning(
-                        "[%s]: no 'model' key in definition data: %s",
-                        entry.get(_key_name),
-                        _definition,
-                    )
-                    return NO_MODEL
-                return _model
-
-            return [
+        _raw_data = message.raw_item.data
+        if not isinstance(_raw_data, list):
+            raise DecodingException(
+                "Bad format: %s - Expected list, got %s",
+                message,
+                type(_raw_data).__name__,
+            )
+        # Devices and their names are collected in a single pass
+        _discovery_result: List[dev.Device] = []
+        _devices: List[str] = []
+        for _entry in _raw_data:
+            if _entry.get(_key_type) not in _device_types:
+                continue
+            _devices.append(_entry.get(_key_name))
+            _discovery_result.append(
                 dev.Device(
-                    name=entry.get(_key_name, NO_FRIENDLY_NAME),
+                    name=_entry.get(_key_name, NO_FRIENDLY_NAME),
                     protocol=dev.Protocol.Z2M,
-                    address=entry.get(_key_address, NO_IEEE_ADDRESS),
-                    model=dev.ModelFactory.get(_get_model(entry)),
+                    address=_entry.get(_key_address, NO_IEEE_ADDRESS),
+                    model=dev.ModelFactory.get(self._get_z2m_model(_entry)),
                 )
-                for entry in raw_message
-                if entry.get(_key_type) in device_type_list
-            ]
-
-        def _device_list(raw_message: dict, device_type_list: List[str]) -> List[str]:
-            return [
-                entry.get(_key_name)
-                for entry in raw_message
-                if entry.get(_key_type) in device_type_list
-            ]
-
-        _raw_data = message.raw_item.data
-        if not isinstance(_raw_data, list):
-            _error_msg = (
-                f"Bad format: {message} - Expected list, got {type(_raw_data).__name__}"
             )
-            raise DecodingException(_error_msg)
-        _discovery_result = _device_dict(_raw_data, device_type_list=_device_types)
         self.directory.update_devices(_discovery_result)
-        _devices = _device_list(_raw_data, device_type_list=_device_types)
         message.refined = abstract.Registry(device_names=_devices)
         return message
 
@@ -394,11 +466,9 @@ class Discoverer(Processor):
 
         _raw_data = message.raw_item.data
         if not isinstance(_raw_data, dict):
-            _error_msg = f"Expecting dict type for: {message}"
-            raise DecodingException(_error_msg)
+            raise DecodingException("Expecting dict type for: %s", message)
         if not all(k in _raw_data for k in (_key_address, _key_name, _key_model)):
-            _error_msg = f"Bad format for: {message}"
-            raise DecodingException(_error_msg)
+            raise DecodingException("Bad format for: %s", message)
         _device_name = _raw_data.get(_key_name)
         _device_address = _raw_data.get(_key_address)
         _device_model = _raw_data.get(_key_model)
@@ -429,12 +499,13 @@ class AvailabilityNormalizer(Processor):
 
     ONLINE = abstract.Availability(is_online=True)
     OFFLINE = abstract.Availability(is_online=False)
-
-    def _decode_availability(self, value: str, on_token: str, off_token: str) -> bool:
-        if value not in (on_token, off_token):
-            _error_msg = f"Unknown availability value: {value}"
-            raise DecodingException(_error_msg)
-        return value == on_token
+    # Availability for each protocol and raw value
+    _AVAILABILITIES: Dict[Tuple[dev.Protocol, str], abstract.Availability] = {
+        (dev.Protocol.TASMOTA, "Online"): ONLINE,
+        (dev.Protocol.TASMOTA, "Offline"): OFFLINE,
+        (dev.Protocol.Z2M, "online"): ONLINE,
+        (dev.Protocol.Z2M, "offline"): OFFLINE,
+    }
 
     def process(self, message: messenger.Message) -> Optional[messenger.Message]:
         """
@@ -453,13 +524,12 @@ class AvailabilityNormalizer(Processor):
             DecodingException: If the message type is not available, the protocol is
             not supported, or the raw data format is incorrect.
         """
-        if message.message_type != messenger.MessageType.AVAIL:
-            _error_msg = f"Not an availability message: {message}"
-            raise DecodingException(_error_msg)
+        if message.message_type is not _AVAIL:
+            raise DecodingException("Not an availability message: %s", message)
         _raw_data = message.raw_item.data
-        if message.protocol == dev.Protocol.TASMOTA:
-            _raw_avail_value = self._decode_availability(_raw_data, "Online", "Offline")
-        elif message.protocol == dev.Protocol.Z2M:
+        if message.protocol is dev.Protocol.TASMOTA:
+            _avail_value = _raw_data
+        elif message.protocol is dev.Protocol.Z2M:
             if isinstance(_raw_data, dict):
                 _avail_value = _raw_data.get("state")
             elif isinstance(_raw_data, str):
@@ -469,15 +539,19 @@ class AvailabilityNormalizer(Processor):
                     f"Bad type {type(_raw_data)} for device {message.device_name}"
                 )
                 raise DecodingException(_error_msg)
-            _raw_avail_value = self._decode_availability(
-                _avail_value, "online", "offline"
-            )
         else:
-            _error_msg = (
-                f"Protocol {message} not covered for device {message.device_name}"
+            raise DecodingException(
+                "Protocol %s not covered for device %s", message, message.device_name
             )
+        _availability = (
+            self._AVAILABILITIES.get((message.protocol, _avail_value))
+            if isinstance(_avail_value, str)
+            else None
+        )
+        if _availability is None:
+            _error_msg = f"Unknown availability value: {_avail_value}"
             raise DecodingException(_error_msg)
-        message.refined = self.ONLINE if _raw_avail_value else self.OFFLINE
+        message.refined = _availability
         return message
 
 
@@ -546,6 +620,17 @@ class StateNormalizer(Processor):
     device state representations. It supports different device models and protocols.
     """
 
+    def __init__(self) -> None:
+        # Refinement for each protocol and Tasmota topic tag, Z2M messages have no tag
+        self._refiners: Dict[
+            Tuple[dev.Protocol, Optional[str]],
+            Callable[[messenger.Message], Optional[messenger.Message]],
+        ] = {
+            (dev.Protocol.Z2M, None): self._refine_z2m,
+            (dev.Protocol.TASMOTA, "STATE"): self._refine_tasmota_state,
+            (dev.Protocol.TASMOTA, "SENSOR"): self._refine_tasmota_sensor,
+        }
+
     def process(self, message: messenger.Message) -> Optional[messenger.Message]:
         """
         Processes a message to normalize its state based on the device model and protocol.
@@ -561,52 +646,69 @@ class StateNormalizer(Processor):
             DecodingException: If the message model is not supported, the raw data format
                 is incorrect, or an error occurs during the refinement process.
         """
-        if message.message_type != messenger.MessageType.STATE:
+        if message.message_type is not _STATE:
             _error_msg = f"Not a state message: {message.message_type}"
             raise DecodingException(_error_msg)
+        _refiner = self._refiners.get((message.protocol, message.raw_item.tag))
+        if _refiner is None:
+            utils.i2m_log.warning("No state normalizer for %s", message.device_name)
+            return None  # No refinement
+        return _refiner(message)
+
+    @staticmethod
+    def _unsupported(message: messenger.Message) -> None:
+        utils.i2m_log.warning(
+            "[%s] Model %s not supported", message.device_name, message.model
+        )
+
+    def _refine_z2m(self, message: messenger.Message) -> Optional[messenger.Message]:
         _raw_data = message.raw_item.data
-        _tag = message.raw_item.tag
         _target_class = StateNormalizerFactory.get(message.model)
-        if message.protocol == dev.Protocol.Z2M:
-            if not _target_class:
-                _error_msg = (
-                    f"[{message.device_name}] Model {message.model} not supported"
-                )
-                utils.i2m_log.warning(_error_msg)
-                return None
-            if not isinstance(_raw_data, dict):
-                _error_msg = f"Bad format: {message}"
-                raise DecodingException(_error_msg)
-            try:
-                message.refined = _target_class(**_raw_data)
-                return message
-            except ValidationError as exc:
-                _error_msg = f"Error when refining raw data: '{_raw_data}': {exc}"
-                utils.i2m_log.error(_error_msg)
-                raise DecodingException(_error_msg)  # Re-raise the exception
-        if message.protocol == dev.Protocol.TASMOTA:
-            if _tag == "STATE":
-                if _raw_data is None:
-                    _error_msg = f"Bad format: {message}"
-                    raise DecodingException(_error_msg)
-                if not _target_class:
-                    _error_msg = (
-                        f"[{message.device_name}] Model {message.model} not supported"
-                    )
-                    utils.i2m_log.warning(_error_msg)
-                    return None
-                message.refined = _target_class(**_raw_data)
-                return message
-            if _tag == "SENSOR":
-                _analog = _raw_data.get("ANALOG")
-                _energy = _raw_data.get("ENERGY")
-                if _analog is not None:
-                    utils.i2m_log.debug("Analog: %s", _analog)
-                if _energy is not None:
-                    utils.i2m_log.debug("Energy: %s", _energy)
-                return message
-        utils.i2m_log.warning("No state normalizer for %s", message.device_name)
-        return None  # No refinement
+        if not _target_class:
+            self._unsupported(message)
+            return None
+        if not isinstance(_raw_data, dict):
+            raise DecodingException("Bad format: %s", message)
+        try:
+            message.refined = _target_class.model_validate(_raw_data)
+            return message
+        except ValidationError as exc:
+            _error = DecodingException(
+                "Error when refining raw data: '%s': %s", _raw_data, exc
+            )
+            utils.i2m_log.error("%s", _error)
+            raise _error  # Re-raise the exception
+
+    def _refine_tasmota_state(
+        self, message: messenger.Message
+    ) -> Optional[messenger.Message]:
+        _raw_data = message.raw_item.data
+        _target_class = StateNormalizerFactory.get(message.model)
+        if not _target_class:
+            self._unsupported(message)
+            return None
+        if not isinstance(_raw_data, dict):
+            raise DecodingException("Bad format: %s", message)
+        try:
+            message.refined = _target_class.model_validate(_raw_data)
+            return message
+        except ValidationError as exc:
+            _error = DecodingException(
+                "Error when refining raw data: '%s': %s", _raw_data, exc
+            )
+            utils.i2m_log.error("%s", _error)
+            raise _error  # Re-raise the exception
+
+    @staticmethod
+    def _refine_tasmota_sensor(message: messenger.Message) -> messenger.Message:
+        _raw_data = message.raw_item.data
+        _analog = _raw_data.get("ANALOG")
+        _energy = _raw_data.get("ENERGY")
+        if _analog is not None:
+            utils.i2m_log.debug("Analog: %s", _analog)
+        if _energy is not None:
+            utils.i2m_log.debug("Energy: %s", _energy)
+        return message
 
 
 class DecodingException(Exception):
@@ -616,12 +718,21 @@ class DecodingException(Exception):
     This exception is raised when a message is received on the wrong topic
     or when there is an issue with decoding the message.
 
+    The message is %-formatted with the optional arguments only when it is read, as
+    logging does, so that messages such as the whole incoming one are not formatted
+    when the exception is caught and dismissed.
+
     Attributes:
         message (str): The error message describing the exception.
     """
 
-    def __init__(self, message: str):
-        self.message = message
+    def __init__(self, message: str, *args: Any):
+        self._message = message
+        self._args = args
+
+    @property
+    def message(self) -> str:
+        return self._message % self._args if self._args else self._message
 
     def __str__(self):
         return self.message
@@ -54,7 +54,9 @@ def check_parameter(
 
     This function validates a parameter by checking if it is of the expected type.
     If the parameter is not optional and is None, or if it is not an instance of the
-    specified type, a TypeError is raised.
+    specified type, a TypeError is raised. Calls on frequently used paths are guarded by
+    ``if __debug__:`` so that the checks are skipped when Python runs with optimizations
+    enabled (python -O).
 
     Args:
         name (str): The name of the parameter being checked.
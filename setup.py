@@ -32,5 +32,5 @@ setup(
     url="https://github.com/slassabe/iot2mqtt",
     packages=['iot2mqtt'],
     scripts=['bin/cli_iot2mqtt'],
-    install_requires=['paho-mqtt', 'certifi', 'requests', 'pydantic'],
+    install_requires=['paho-mqtt', 'certifi', 'requests', 'pydantic', 'orjson'],
 )